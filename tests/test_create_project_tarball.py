@@ -0,0 +1,27 @@
+import tarfile
+
+import pytest
+
+from src.python_project_generator import ProjectGenerator
+
+
+def test_tarball_contiene_el_proyecto(tmp_path):
+    destino = ProjectGenerator("demo", "3.10").create_project_tarball(tmp_path / "demo.tar")
+
+    with tarfile.open(destino) as tar:
+        nombres = tar.getnames()
+        assert "demo/src" in nombres
+        assert all(nombre == "demo" or nombre.startswith("demo/") for nombre in nombres)
+        assert b"target-version = ['py310']" in tar.extractfile("demo/pyproject.toml").read()
+        assert b"PROJECT_NAME=demo\n" in tar.extractfile("demo/.env.example").read()
+
+
+@pytest.mark.parametrize("nombre, version", [
+    ("../../escape", "3.9"),
+    ("demo", "3.13"),
+])
+def test_tarball_rechaza_parametros_invalidos(tmp_path, nombre, version):
+    destino = tmp_path / "proyecto.tar"
+    with pytest.raises(ValueError):
+        ProjectGenerator(nombre, version).create_project_tarball(destino)
+    assert not destino.exists()
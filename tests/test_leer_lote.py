@@ -0,0 +1,33 @@
+import io
+
+import pytest
+
+from src.python_project_generator import leer_lote
+
+
+def test_lote_json_con_version_por_defecto():
+    archivo = io.StringIO('[["alpha", "3.10"], ["beta"], [" gamma ", ""]]')
+    assert leer_lote(archivo) == [("alpha", "3.10"), ("beta", "3.9"), ("gamma", "3.9")]
+
+
+def test_lote_csv_con_version_por_defecto():
+    archivo = io.StringIO("alpha,3.10\n\nbeta\ngamma, 3.11 \n")
+    assert leer_lote(archivo) == [("alpha", "3.10"), ("beta", "3.9"), ("gamma", "3.11")]
+
+
+@pytest.mark.parametrize("contenido", [
+    '["alpha", "beta"]',
+    '[["x", 3.10]]',
+    '[{"nombre": "x"}]',
+    '[["x", "3.9", "extra"]]',
+    '[[]]',
+    '[["x", "3.9"]',
+])
+def test_lote_json_invalido(contenido):
+    with pytest.raises(ValueError):
+        leer_lote(io.StringIO(contenido))
+
+
+def test_lote_csv_con_columnas_de_mas():
+    with pytest.raises(ValueError):
+        leer_lote(io.StringIO("alpha,3.10,extra\n"))